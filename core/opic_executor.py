@@ -6,7 +6,8 @@ Integrates with opic's reasoning, math, and Field Spec 0.7 systems
 
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
 import json
 import hashlib
 import math
@@ -1185,27 +1186,70 @@ class OpicExecutor:
             # Filter by substring
             return [item for item in items if pattern in str(item)]
         
+        def is_ndarray(values: Any) -> bool:
+            """True for numpy arrays — spectral primitives pass these through without list round-trips"""
+            return hasattr(values, "__array_interface__")
+        
+        @lru_cache(maxsize=32)
+        def dft_twiddles(n: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+            """cos/sin of 2πj/n for j < n — the scalar DFT indexes these by (k·i) mod n"""
+            return (tuple(math.cos(2 * math.pi * j / n) for j in range(n)),
+                    tuple(math.sin(2 * math.pi * j / n) for j in range(n)))
+        
+        @lru_cache(maxsize=1)
+        def fftn_backend() -> Tuple[Any, Dict[str, Any]]:
+            """scipy.fft with worker threads for batched 3D transforms, numpy.fft otherwise
+            
+            OPIC_FFT_WORKERS sets the scipy worker count (default -1: all cores).
+            """
+            import os
+            try:
+                from scipy import fft as scipy_fft
+                return scipy_fft, {"workers": int(os.environ.get("OPIC_FFT_WORKERS", "-1"))}
+            except ImportError:
+                import numpy as np
+                return np.fft, {}
+        
         def fft_unitary(env: Dict[str, Any]) -> List[complex]:
             """FFT with unitary normalization — implements fft.unitary"""
             import cmath
             field_values = env.get("field", env.get("field_values", []))
-            if not isinstance(field_values, list):
+            if not isinstance(field_values, list) and not is_ndarray(field_values):
                 return []
             
             n = len(field_values)
+            if n == 0:
+                return []
+            
+            # Real fields only need k = 0..n/2; ifft.unitary restores the rest from Hermitian symmetry
+            half_spectrum = bool(env.get("half_spectrum", False))
+            
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                # O(n log n) FFT; norm="ortho" is the 1/√n unitary normalization
+                values = np.asarray(field_values, dtype=float)
+                spectrum = np.fft.rfft(values, norm="ortho") if half_spectrum else np.fft.fft(values, norm="ortho")
+                return spectrum if is_ndarray(field_values) else spectrum.tolist()
+            
             spectrum = []
+            cos_table, sin_table = dft_twiddles(n)
+            inv_norm = 1.0 / math.sqrt(n)  # unitary normalization 1/√n
             
-            for k in range(n):
+            for k in range(n // 2 + 1 if half_spectrum else n):
                 real_sum = 0.0
                 imag_sum = 0.0
                 
                 for i in range(n):
-                    angle = -2 * math.pi * k * i / n
-                    real_sum += field_values[i] * math.cos(angle)
-                    imag_sum += field_values[i] * math.sin(angle)
+                    # e^{-2πiki/n}: cos is even, sin is odd
+                    j = (k * i) % n
+                    real_sum += field_values[i] * cos_table[j]
+                    imag_sum -= field_values[i] * sin_table[j]
                 
-                # Unitary normalization: 1/√n
-                spectrum.append(complex(real_sum / math.sqrt(n), imag_sum / math.sqrt(n)))
+                spectrum.append(complex(real_sum * inv_norm, imag_sum * inv_norm))
             
             return spectrum
         
@@ -1213,24 +1257,51 @@ class OpicExecutor:
             """IFFT with unitary normalization — implements ifft.unitary"""
             import cmath
             spectrum = env.get("spectrum", env.get("complex_spectrum", []))
-            if not isinstance(spectrum, list):
+            if not isinstance(spectrum, list) and not is_ndarray(spectrum):
                 return []
             
             n = len(spectrum)
+            if n == 0:
+                return []
+            
+            # Half spectrum (k = 0..n/2) when the field size says so — Hermitian symmetry is implicit
+            field_size = int(env.get("n", env.get("field_size", n)))
+            half_spectrum = field_size > n and n == field_size // 2 + 1
+            
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                if half_spectrum:
+                    field = np.fft.irfft(np.asarray(spectrum, dtype=complex), n=field_size, norm="ortho")
+                else:
+                    # Real part of the unitary inverse, same as the Σ Re(F(k) e^{2πiki/n}) loop below
+                    field = np.fft.ifft(np.asarray(spectrum, dtype=complex), norm="ortho").real
+                return field if is_ndarray(spectrum) else field.tolist()
+            
+            if half_spectrum:
+                # Mirror F(-k) = F*(k) to recover the full-length spectrum
+                spectrum = list(spectrum) + [complex(spectrum[field_size - k]).conjugate()
+                                             for k in range(n, field_size)]
+                n = field_size
+            
             field = []
+            cos_table, sin_table = dft_twiddles(n)
+            inv_norm = 1.0 / math.sqrt(n)  # unitary normalization 1/√n
             
             for i in range(n):
                 real_sum = 0.0
                 
                 for k in range(n):
-                    angle = 2 * math.pi * k * i / n
+                    j = (k * i) % n
                     if isinstance(spectrum[k], complex):
-                        real_sum += spectrum[k].real * math.cos(angle) - spectrum[k].imag * math.sin(angle)
+                        real_sum += spectrum[k].real * cos_table[j] - spectrum[k].imag * sin_table[j]
                     else:
-                        real_sum += float(spectrum[k]) * math.cos(angle)
+                        real_sum += float(spectrum[k]) * cos_table[j]
                 
-                # Unitary normalization: 1/√n
-                field.append(real_sum / math.sqrt(n))
+                field.append(real_sum * inv_norm)
             
             return field
         
@@ -1240,9 +1311,31 @@ class OpicExecutor:
             spectrum = env.get("spectrum", env.get("complex_spectrum", []))
             n = env.get("n", env.get("field_size", len(spectrum)))
             
-            if not isinstance(spectrum, list):
+            if not isinstance(spectrum, list) and not is_ndarray(spectrum):
                 return []
             
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                hermitian = np.array(spectrum, dtype=complex)
+                
+                # DC and Nyquist (if n is even) must be real
+                if hermitian.size > 0:
+                    hermitian[0] = hermitian[0].real
+                if n % 2 == 0 and hermitian.size > n // 2:
+                    hermitian[n//2] = hermitian[n//2].real
+                
+                # F(-k) = F*(k) for k = 1..(n-1)/2 as a single reversed-conjugate slice
+                k_lo = max(1, n - hermitian.size + 1)
+                k_hi = (n + 1) // 2
+                if k_lo < k_hi:
+                    hermitian[n - k_hi + 1:n - k_lo + 1] = np.conj(hermitian[k_lo:k_hi][::-1])
+                
+                return hermitian if is_ndarray(spectrum) else hermitian.tolist()
+            
             hermitian = [complex(s.real, s.imag) if isinstance(s, complex) else complex(float(s), 0) for s in spectrum]
             
             # Handle k=0 (DC) - must be real
@@ -1264,6 +1357,9 @@ class OpicExecutor:
         def compute_power_spectrum(env: Dict[str, Any]) -> List[float]:
             """Compute power spectrum P(k) = |F(k)|² — implements compute.power.spectrum"""
             spectrum = env.get("spectrum", env.get("complex_spectrum", []))
+            if is_ndarray(spectrum):
+                # |F|² as one vectorized pass, kept as an array for downstream primitives
+                return spectrum.real**2 + spectrum.imag**2
             if not isinstance(spectrum, list):
                 return []
             
@@ -1281,14 +1377,26 @@ class OpicExecutor:
             field = env.get("original_field", env.get("field", []))
             spectrum = env.get("original_spectrum", env.get("spectrum", []))
             
-            if not isinstance(field, list) or not isinstance(spectrum, list):
+            if not (isinstance(field, list) or is_ndarray(field)) or not (isinstance(spectrum, list) or is_ndarray(spectrum)):
                 return {"passes": False, "error": "Invalid input"}
             
-            # Spectrum energy: Σ|F(k)|²
-            spectrum_energy = sum(abs(s)**2 for s in spectrum)
-            
-            # Field energy: Σf(x)²
-            field_energy = sum(f**2 for f in field)
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                # Spectrum energy Σ|F(k)|² and field energy Σf(x)² as single reductions
+                spec = np.asarray(spectrum, dtype=complex)
+                values = np.asarray(field, dtype=float)
+                spectrum_energy = float(np.vdot(spec, spec).real)
+                field_energy = float(np.dot(values, values))
+            else:
+                # Spectrum energy: Σ|F(k)|²
+                spectrum_energy = sum(abs(s)**2 for s in spectrum)
+                
+                # Field energy: Σf(x)²
+                field_energy = sum(f**2 for f in field)
             
             # Difference
             diff = abs(spectrum_energy - field_energy)
@@ -1307,12 +1415,21 @@ class OpicExecutor:
             original = env.get("original_field", env.get("original", []))
             reconstructed = env.get("reconstructed_field", env.get("reconstructed", []))
             
-            if not isinstance(original, list) or not isinstance(reconstructed, list):
+            if not (isinstance(original, list) or is_ndarray(original)) or not (isinstance(reconstructed, list) or is_ndarray(reconstructed)):
                 return float('inf')
             
             if len(original) != len(reconstructed):
                 return float('inf')
             
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                diff = np.asarray(original, dtype=float) - np.asarray(reconstructed, dtype=float)
+                return float(np.linalg.norm(diff))
+            
             errors = [(original[i] - reconstructed[i])**2 for i in range(len(original))]
             return math.sqrt(sum(errors))
         
@@ -1321,12 +1438,21 @@ class OpicExecutor:
             original = env.get("original_field", env.get("original", []))
             reconstructed = env.get("reconstructed_field", env.get("reconstructed", []))
             
-            if not isinstance(original, list) or not isinstance(reconstructed, list):
+            if not (isinstance(original, list) or is_ndarray(original)) or not (isinstance(reconstructed, list) or is_ndarray(reconstructed)):
                 return float('inf')
             
             if len(original) != len(reconstructed):
                 return float('inf')
             
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                diff = np.asarray(original, dtype=float) - np.asarray(reconstructed, dtype=float)
+                return float(np.abs(diff).max()) if diff.size else 0.0
+            
             errors = [abs(original[i] - reconstructed[i]) for i in range(len(original))]
             return max(errors) if errors else 0.0
         
@@ -1368,20 +1494,58 @@ class OpicExecutor:
                 "histogram": hist
             }
         
+        def generate_uniform_phases(env: Dict[str, Any]) -> List[float]:
+            """Random phases φ_k ~ U[0,2π), one per power-spectrum mode — implements generate.uniform.phases"""
+            power_spectrum = env.get("power_spectrum", env.get("power", []))
+            if not isinstance(power_spectrum, list) and not is_ndarray(power_spectrum):
+                power_spectrum = []
+            n = int(env.get("n", len(power_spectrum)))
+            seed = env.get("random_seed", env.get("seed"))
+            seed = int(seed) if seed is not None else None
+            
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                # One batched PCG64 draw instead of n random.random() calls
+                phases = np.random.default_rng(seed).uniform(0.0, 2 * math.pi, n)
+                return phases if is_ndarray(power_spectrum) else phases.tolist()
+            
+            rng = random.Random(seed)
+            return [2 * math.pi * rng.random() for _ in range(n)]
+        
         def compare_power_spectra(env: Dict[str, Any]) -> Dict[str, Any]:
             """Compare power spectra: max|ΔP(k)|, RMSE — CABA validation"""
             original_power = env.get("original_power", env.get("original", []))
             reconstructed_power = env.get("reconstructed_power", env.get("reconstructed", []))
             
-            if not isinstance(original_power, list) or not isinstance(reconstructed_power, list):
+            if not (isinstance(original_power, list) or is_ndarray(original_power)) or not (isinstance(reconstructed_power, list) or is_ndarray(reconstructed_power)):
                 return {"passes": False, "error": "Invalid input"}
             
             if len(original_power) != len(reconstructed_power):
                 return {"passes": False, "error": "Length mismatch"}
             
-            errors = [abs(orig - recon) for orig, recon in zip(original_power, reconstructed_power)]
-            max_error = max(errors) if errors else 0.0
-            rmse = math.sqrt(sum(e**2 for e in errors) / len(errors)) if errors else 0.0
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            
+            if np is not None:
+                errors = np.abs(np.asarray(original_power, dtype=float) - np.asarray(reconstructed_power, dtype=float))
+                max_error = float(errors.max()) if errors.size else 0.0
+                rmse = math.sqrt(float(np.dot(errors, errors)) / errors.size) if errors.size else 0.0
+            else:
+                # One pass: max and sum of squares share each |ΔP(k)|
+                max_error = 0.0
+                sum_sq = 0.0
+                for orig, recon in zip(original_power, reconstructed_power):
+                    e = abs(orig - recon)
+                    if e > max_error:
+                        max_error = e
+                    sum_sq += e * e
+                rmse = math.sqrt(sum_sq / len(original_power)) if original_power else 0.0
             
             return {
                 "max_error": max_error,
@@ -1732,13 +1896,14 @@ class OpicExecutor:
             kx, ky, kz = np.meshgrid(k, k, k, indexing='ij')
             
             # FFT to k-space
-            u_hat = np.fft.fftn(u, axes=(1, 2, 3)) / (N ** 1.5)
+            fft, fft_kwargs = fftn_backend()
+            u_hat = fft.fftn(u, axes=(1, 2, 3), **fft_kwargs) / (N ** 1.5)
             
             # Compute divergence in k-space: ∇·u = ik·û
             div_hat = 1j * (kx * u_hat[0] + ky * u_hat[1] + kz * u_hat[2])
             
             # IFFT back
-            div = np.fft.ifftn(div_hat, axes=(0, 1, 2)) * (N ** 1.5)
+            div = fft.ifftn(div_hat, axes=(0, 1, 2), **fft_kwargs) * (N ** 1.5)
             div = np.real(div)
             
             # L2 norm
@@ -1799,7 +1964,8 @@ class OpicExecutor:
                 return u.tolist() if hasattr(u, 'tolist') else u
             
             # Unitary FFT: divide by N^(3/2)
-            u_hat = np.fft.fftn(u, axes=axes) / (N ** 1.5)
+            fft, fft_kwargs = fftn_backend()
+            u_hat = fft.fftn(u, axes=axes, **fft_kwargs) / (N ** 1.5)
             
             return u_hat.tolist() if hasattr(u_hat, 'tolist') else u_hat
         
@@ -1828,7 +1994,8 @@ class OpicExecutor:
                 return u_hat.tolist() if hasattr(u_hat, 'tolist') else u_hat
             
             # Unitary IFFT: multiply by N^(3/2)
-            u = np.fft.ifftn(u_hat, axes=axes) * (N ** 1.5)
+            fft, fft_kwargs = fftn_backend()
+            u = fft.ifftn(u_hat, axes=axes, **fft_kwargs) * (N ** 1.5)
             u = np.real(u)
             
             return u.tolist() if hasattr(u, 'tolist') else u
@@ -1855,7 +2022,8 @@ class OpicExecutor:
             kx, ky, kz = np.meshgrid(k, k, k, indexing='ij')
             
             # FFT to k-space
-            u_hat = np.fft.fftn(u, axes=(1, 2, 3)) / (N ** 1.5)
+            fft, fft_kwargs = fftn_backend()
+            u_hat = fft.fftn(u, axes=(1, 2, 3), **fft_kwargs) / (N ** 1.5)
             
             # Compute vorticity ω = ∇ × u in k-space
             omega_hat = np.zeros_like(u_hat)
@@ -1864,7 +2032,7 @@ class OpicExecutor:
             omega_hat[2] = 1j * (kx * u_hat[1] - ky * u_hat[0])  # ω_z
             
             # IFFT back
-            omega = np.fft.ifftn(omega_hat, axes=(1, 2, 3)) * (N ** 1.5)
+            omega = fft.ifftn(omega_hat, axes=(1, 2, 3), **fft_kwargs) * (N ** 1.5)
             omega = np.real(omega)
             
             # Compute flatness for each component
@@ -3199,6 +3367,8 @@ if __name__ == "__main__":
             "compute.linf.error": compute_linf_error,
             "verify_phase_uniformity": verify_phase_uniformity,
             "verify.phase.uniformity": verify_phase_uniformity,
+            "generate_uniform_phases": generate_uniform_phases,
+            "generate.uniform.phases": generate_uniform_phases,
             "compare_power_spectra": compare_power_spectra,
             "compare.power.spectra": compare_power_spectra,
             "compare_correlation_functions": compare_correlation_functions,
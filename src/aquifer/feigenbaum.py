@@ -15,6 +15,8 @@ Applications:
 - Chaos-aware control flow design
 """
 
+import numpy as np
+
 # Feigenbaum's constant (first Feigenbaum constant)
 FEIGENBAUM_DELTA = 4.669201609102990671853203820466  # Universal scaling ratio
 
@@ -88,25 +90,154 @@ def feigenbaum_constrain(parameter_space, target_behavior, tolerance=1e-6):
     }
 
 
-def compute_feigenbaum_sequence(map_function, param_range, max_iterations=1000):
+def compute_feigenbaum_sequence(map_function, param_range, max_iterations=1000,
+                                num_samples=4000, max_period=64, tolerance=1e-6,
+                                max_refinements=5):
     """
     Compute the bifurcation sequence for a given map function.
     
+    The map is iterated for every parameter value of a grid over param_range
+    at once (see _orbit_sweep), the attractor period at each grid point is
+    read off the sampled orbit, and a bifurcation is recorded wherever the
+    period doubles between neighbouring grid points.
+    
     Args:
         map_function (callable): Function f(x, r) representing the map
+            Should accept NumPy arrays for x and r (e.g. lambda x, r: r*x*(1-x));
+            scalar-only functions are wrapped with np.vectorize
         param_range (tuple): (r_min, r_max) parameter range to explore
-        max_iterations (int): Maximum iterations for attractor detection
+        max_iterations (int): Transient iterations discarded before sampling
+            the orbit in the first pass over the whole grid (see
+            max_refinements for unresolved points)
+        num_samples (int): Number of parameter values in the sweep grid
+        max_period (int): Largest period (power of two) to resolve
+        tolerance (float): Orbit points closer than this are considered equal
+        max_refinements (int): Extra passes over grid points whose period is
+            still unresolved; each continues their orbits with twice the
+            previous transient, so the slowest rows get up to
+            2^(max_refinements+1) - 1 times max_iterations iterations
     
     Returns:
         list: Sequence of bifurcation parameter values [a₀, a₁, a₂, ...]
+            Each value is the midpoint between the last grid point of period p
+            and the first grid point of period 2p. Grid points close to a
+            bifurcation converge slowly (critical slowing down) and may stay
+            unresolved, widening that gap; more iterations narrow it.
     
-    Implementation Notes:
-        - TODO: Implement period detection using Poincaré section analysis
-        - TODO: Detect bifurcation points where period doubles
-        - TODO: Return ordered sequence of bifurcation parameters
+    Example:
+        >>> logistic = lambda x, r: r * x * (1 - x)
+        >>> compute_feigenbaum_sequence(logistic, (2.5, 3.6))[:3]
+        [2.9999..., 3.4493..., 3.5440...]  # exact: 3, 3.44949, 3.54409
     """
-    # Placeholder
-    return []
+    r_min, r_max = param_range
+    if not r_min < r_max:
+        raise ValueError("param_range must be an increasing (r_min, r_max) pair")
+    
+    r_values = np.linspace(r_min, r_max, num_samples)
+    n_sample = 4 * max_period
+    orbits = _orbit_sweep(map_function, r_values, max_iterations, n_sample)
+    periods = _detect_periods(orbits, max_period, tolerance)
+    
+    # Convergence-based transient: rows still unresolved (critical slowing
+    # down near a bifurcation, or chaos) keep iterating from where they
+    # stopped, with the transient doubling each round
+    x_last = orbits[:, -1].copy()
+    n_transient = max_iterations
+    for _ in range(max_refinements):
+        rows = np.flatnonzero(periods == 0)
+        if rows.size == 0:
+            break
+        n_transient *= 2
+        orbits = _orbit_sweep(map_function, r_values[rows], n_transient, n_sample,
+                              x0=x_last[rows])
+        x_last[rows] = orbits[:, -1]
+        periods[rows] = _detect_periods(orbits, max_period, tolerance)
+    
+    bifurcations = []
+    cascade_period = 0
+    last_r, last_period = None, 0
+    for r, period in zip(r_values.tolist(), periods.tolist()):
+        if period == 0:
+            continue  # unresolved (near a bifurcation), chaotic or divergent
+        if period == 2 * last_period and period > cascade_period:
+            bifurcations.append(0.5 * (last_r + r))
+            cascade_period = period
+        last_r, last_period = r, period
+    
+    return bifurcations
+
+
+def _orbit_sweep(map_function, r_values, n_transient, n_sample, x0=0.5):
+    """
+    Iterate the map for all parameter values simultaneously.
+    
+    Every r is independent, so each iteration is one vectorized call over
+    the whole parameter grid rather than a Python loop per r.
+    
+    Returns:
+        np.ndarray: Orbit samples of shape (len(r_values), n_sample)
+    """
+    x = np.broadcast_to(np.asarray(x0, dtype=np.float64), r_values.shape).copy()
+    try:
+        # Two elements: math.* functions still accept length-1 arrays, and
+        # branching on x raises ValueError (ambiguous truth value) on arrays
+        map_function(x[:2], r_values[:2])
+    except (TypeError, ValueError):
+        map_function = np.vectorize(map_function, otypes=[np.float64])
+    
+    orbits = np.empty((r_values.size, n_sample), dtype=np.float64)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for _ in range(n_transient):
+            x = map_function(x, r_values)
+        for j in range(n_sample):
+            x = map_function(x, r_values)
+            orbits[:, j] = x
+    return orbits
+
+
+def _detect_periods(orbits, max_period, tolerance):
+    """
+    Smallest power-of-two period p ≤ max_period with |xⱼ₊ₚ - xⱼ| < tolerance
+    along each orbit row; 0 where no such period exists.
+    
+    An orbit still slowly converging to period p/2 (critical slowing down
+    near a bifurcation) also passes the period-p test, so p is accepted only
+    if the lag-p/2 spread is not decaying towards zero: its maxima over
+    three consecutive p-sample windows are Aitken-extrapolated, and rows
+    whose limit falls below half the current spread stay unresolved (0).
+    """
+    periods = np.zeros(orbits.shape[0], dtype=np.int64)
+    undecided = np.ones(orbits.shape[0], dtype=bool)
+    period = 1
+    with np.errstate(invalid='ignore', divide='ignore'):
+        while period <= max_period and 4 * period <= orbits.shape[1]:
+            spread = np.abs(orbits[:, period:] - orbits[:, :-period]).max(axis=1)
+            candidate = undecided & (spread < tolerance)
+            if period > 1:
+                decaying = candidate & _spread_decays_to_zero(orbits, period // 2, period)
+                undecided &= ~decaying
+                candidate &= ~decaying
+            periods[candidate] = period
+            undecided &= ~candidate
+            period *= 2
+    return periods
+
+
+def _spread_decays_to_zero(orbits, lag, window):
+    """
+    Whether the spread |x[j + lag] - x[j]| shrinks geometrically towards zero.
+    
+    Takes the spread maxima a₀, a₁, a₂ over the last three windows and
+    extrapolates their limit a₂ + d₂·q/(1 - q), with dₖ = aₖ - aₖ₋₁ and
+    q = d₂/d₁.
+    """
+    half_spread = np.abs(orbits[:, lag:] - orbits[:, :-lag])[:, -3 * window:]
+    a0, a1, a2 = half_spread.reshape(orbits.shape[0], 3, window).max(axis=2).T
+    d1, d2 = a1 - a0, a2 - a1
+    q = d2 / d1
+    geometric = (d1 < 0) & (d2 < 0) & (q < 1)
+    limit = a2 + d2 * q / (1 - q)
+    return geometric & (limit < 0.5 * a2)
 
 
 def verify_universal_scaling(bifurcation_sequence, tolerance=1e-6):
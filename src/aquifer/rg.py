@@ -18,9 +18,14 @@ Applications:
 - Stable parameter selection near critical points
 """
 
+import numpy as np
+
+# Initial trajectory buffer rows in rg_flow, before geometric growth
+_INITIAL_TRAJECTORY_ROWS = 16
+
 
 def rg_flow(operator, initial_state, steps, rescale_fn=None, 
-            convergence_threshold=1e-6):
+            convergence_threshold=1e-6, dtype=np.float64):
     """
     Evolve a system under renormalization group flow.
     
@@ -32,50 +37,59 @@ def rg_flow(operator, initial_state, steps, rescale_fn=None,
         operator (callable): RG transformation T: state -> state
             Should implement one step of coarse-graining/rescaling
             Signature: operator(state, scale_factor) -> new_state
-        initial_state (dict or array-like): Initial system configuration
-            Format depends on system being analyzed
+        initial_state (array-like): Initial system configuration
+            Coerced to an ndarray of dtype; the operator must return states of
+            the same shape (e.g. coarse-grained and rescaled back to size)
         steps (int): Number of RG transformation steps to apply
         rescale_fn (callable, optional): Custom rescaling function
             If None, uses default geometric rescaling
             Signature: rescale_fn(state, step_number) -> rescaled_state
         convergence_threshold (float): Threshold for fixed-point detection
             If |T(state) - state| < threshold, consider converged
+        dtype (np.dtype): Storage dtype for states along the trajectory
+            np.float32 halves memory traffic for large lattices; block
+            averaging suppresses rounding noise, but keep the threshold
+            well above the dtype's resolution. Distances are float64.
     
     Returns:
         dict: RG flow results
             {
-                'trajectory': list of states at each RG step,
+                'trajectory': ndarray of states, shape (n_steps + 1, *state.shape),
                 'fixed_point': final state (if converged) or None,
                 'converged': bool (whether flow reached fixed point),
                 'convergence_step': int (step where convergence occurred) or None,
                 'critical_exponents': list of eigenvalues (if at fixed point),
-                'flow_distance': list of distances between successive states,
+                'flow_distance': ndarray of distances between successive states,
                 'universality_class': str (classification if identifiable)
             }
     
     Raises:
         ValueError: If operator or initial_state is invalid
         RuntimeError: If flow diverges or exhibits pathological behavior
+        OverflowError: If the flow runs past step 1023 without converging,
+            where the scale factor 2**step no longer fits in a float64
     
     Example:
         >>> def block_spin_rg(state, scale):
-        ...     # Example: 2x2 block spin coarse-graining
-        ...     return coarse_grain_2x2(state)
+        ...     # 2x2 block-spin average, expanded back to the lattice size
+        ...     blocks = state.reshape(32, 2, 32, 2).mean(axis=(1, 3))
+        ...     return np.repeat(np.repeat(blocks, 2, axis=0), 2, axis=1)
         >>> 
-        >>> initial = create_ising_lattice(64, 64, T=2.27)  # Near critical temp
+        >>> initial = np.random.default_rng(0).choice([-1.0, 1.0], size=(64, 64))
         >>> result = rg_flow(block_spin_rg, initial, steps=10)
-        >>> print(result['converged'])
-        True
-        >>> print(result['universality_class'])
-        'Ising 2D'
+        >>> print(result['converged'], result['convergence_step'])
+        True 1
+        >>> print(result['trajectory'].shape)
+        (3, 64, 64)
     
     Implementation Notes:
-        - TODO: Implement iterative RG transformation application
-        - TODO: Check convergence at each step using norm ||T(s) - s||
+        - States are written in place into one contiguous (rows, *shape)
+          buffer that starts at a few rows and doubles as needed, since the
+          flow usually converges well before steps; the returned trajectory
+          is trimmed to the steps actually taken
         - TODO: Compute critical exponents via linearization at fixed point
         - TODO: Classify universality class based on fixed-point structure
         - TODO: Detect limit cycles and other non-fixed-point attractors
-        - TODO: Handle divergent flows gracefully
     """
     # Input validation
     if operator is None or not callable(operator):
@@ -87,44 +101,78 @@ def rg_flow(operator, initial_state, steps, rescale_fn=None,
     if steps < 1:
         raise ValueError("steps must be positive")
     
-    # Placeholder implementation
-    trajectory = [initial_state]
+    try:
+        s0 = np.asarray(initial_state, dtype=dtype)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"initial_state must be array-like: {e}")
+    
+    # The scale factor 2**step must stay a finite float64, so at most
+    # max_steps steps can run; steps is only a cap, so the trajectory
+    # buffer starts small and doubles as the flow proceeds
+    max_steps = min(steps, np.finfo(np.float64).maxexp)
+    capacity = min(max_steps, _INITIAL_TRAJECTORY_ROWS)
+    trajectory = np.empty((capacity + 1,) + s0.shape, dtype=s0.dtype)
+    trajectory[0] = s0
+    flow_distance = np.empty(max_steps, dtype=np.float64)
+    scales = np.ldexp(1.0, np.arange(max_steps))  # 2**step, without a pow per step
     converged = False
     convergence_step = None
     
-    # TODO: Implement actual RG flow iteration
-    # for step in range(steps):
-    #     current_state = trajectory[-1]
-    #     
-    #     # Apply RG transformation
-    #     if rescale_fn is not None:
-    #         rescaled_state = rescale_fn(current_state, step)
-    #         next_state = operator(rescaled_state, 2.0 ** step)
-    #     else:
-    #         next_state = operator(current_state, 2.0 ** step)
-    #     
-    #     trajectory.append(next_state)
-    #     
-    #     # Check convergence
-    #     distance = compute_state_distance(current_state, next_state)
-    #     if distance < convergence_threshold:
-    #         converged = True
-    #         convergence_step = step
-    #         break
+    step = 0
+    for step in range(max_steps):
+        if step == capacity:
+            capacity = min(2 * capacity, max_steps)
+            grown = np.empty((capacity + 1,) + s0.shape, dtype=s0.dtype)
+            grown[:step + 1] = trajectory[:step + 1]
+            trajectory = grown
+        current_state = trajectory[step]
+        scale = scales[step]
+        
+        # Apply RG transformation
+        if rescale_fn is not None:
+            next_state = operator(rescale_fn(current_state, step), scale)
+        else:
+            next_state = operator(current_state, scale)
+        
+        try:
+            trajectory[step + 1] = next_state
+        except ValueError as e:
+            raise ValueError(f"operator changed the state shape at step {step}: {e}")
+        
+        # Check convergence
+        distance = np.linalg.norm(np.subtract(trajectory[step + 1], current_state,
+                                              dtype=np.float64))
+        flow_distance[step] = distance
+        if not np.isfinite(distance):
+            raise RuntimeError(f"RG flow diverged at step {step}")
+        if distance < convergence_threshold:
+            converged = True
+            convergence_step = step
+            break
+    else:
+        if steps > max_steps:
+            raise OverflowError(f"scale factor 2**{max_steps} exceeds the float64 range")
+    
+    n_steps = step + 1
+    if n_steps < capacity:
+        # Copy so the unused tail of the buffer is released
+        trajectory = trajectory[:n_steps + 1].copy()
+        flow_distance = flow_distance[:n_steps].copy()
     
     return {
         'trajectory': trajectory,
-        'fixed_point': None,  # TODO: Return actual fixed point if converged
+        'fixed_point': trajectory[n_steps] if converged else None,
         'converged': converged,
         'convergence_step': convergence_step,
         'critical_exponents': [],  # TODO: Compute eigenvalues at fixed point
-        'flow_distance': [],  # TODO: Track distances between successive states
+        'flow_distance': flow_distance[:n_steps],
         'universality_class': 'unknown',  # TODO: Classify based on fixed point
-        'note': 'Placeholder implementation - full RG flow analysis pending'
+        'note': 'Critical exponents and universality classification pending'
     }
 
 
-def compute_critical_exponents(operator, fixed_point, perturbation_size=1e-4):
+def compute_critical_exponents(operator, fixed_point, perturbation_size=1e-4,
+                               marginal_tolerance=1e-3):
     """
     Compute critical exponents at a fixed point via linearization.
     
@@ -136,6 +184,7 @@ def compute_critical_exponents(operator, fixed_point, perturbation_size=1e-4):
         operator (callable): RG transformation T(state)
         fixed_point (state): Fixed point where T(s*) = s*
         perturbation_size (float): Size of perturbations for numerical derivative
+        marginal_tolerance (float): Exponents with ||λ| - 1| below this are marginal
     
     Returns:
         dict: Critical exponent analysis
@@ -148,18 +197,40 @@ def compute_critical_exponents(operator, fixed_point, perturbation_size=1e-4):
             }
     
     Implementation Notes:
-        - TODO: Numerically compute Jacobian matrix dT/ds at fixed point
-        - TODO: Compute eigenvalue decomposition
-        - TODO: Classify operators as relevant/irrelevant/marginal
+        - Jacobian columns are forward differences along each coordinate,
+          evaluated from the stacked perturbations s* + εI
+        - Exponents are sorted by descending magnitude
     """
-    # Placeholder
+    s_star = np.asarray(fixed_point, dtype=np.float64)
+    shape = s_star.shape
+    d = s_star.size
+    
+    base = np.asarray(operator(s_star), dtype=np.float64).reshape(d)
+    perturbed = s_star.reshape(1, d) + perturbation_size * np.eye(d)
+    responses = np.stack([
+        np.asarray(operator(row.reshape(shape)), dtype=np.float64).reshape(d)
+        for row in perturbed
+    ])
+    # responses[j] = T(s* + ε eⱼ), so column j of dT/ds is (responses[j] - T(s*)) / ε
+    jacobian = (responses - base).T / perturbation_size
+    
+    eigenvalues, eigenvectors = np.linalg.eig(jacobian)
+    order = np.argsort(-np.abs(eigenvalues), kind='stable')
+    eigenvalues = eigenvalues[order]
+    eigenvectors = eigenvectors[:, order]
+    if not np.iscomplexobj(eigenvalues) or not eigenvalues.imag.any():
+        eigenvalues = eigenvalues.real
+        eigenvectors = eigenvectors.real
+    
+    magnitude = np.abs(eigenvalues)
+    marginal = np.abs(magnitude - 1) <= marginal_tolerance
+    
     return {
-        'exponents': [],
-        'eigenvectors': [],
-        'relevant_operators': [],
-        'irrelevant_operators': [],
-        'marginal_operators': [],
-        'note': 'Placeholder - critical exponent computation pending'
+        'exponents': eigenvalues.tolist(),
+        'eigenvectors': eigenvectors.T.tolist(),
+        'relevant_operators': eigenvalues[(magnitude > 1) & ~marginal].tolist(),
+        'irrelevant_operators': eigenvalues[(magnitude < 1) & ~marginal].tolist(),
+        'marginal_operators': eigenvalues[marginal].tolist()
     }
 
 
@@ -212,10 +283,44 @@ def check_convergence(state1, state2, threshold=1e-6, metric='l2'):
     Returns:
         tuple: (converged: bool, distance: float)
     
+    Raises:
+        ValueError: If metric is unknown, the states differ in shape, or
+            dict states have different keys
+    
     Implementation Notes:
-        - TODO: Implement multiple distance metrics
-        - TODO: Handle different state representations (dict, array, custom)
-        - TODO: Return both boolean convergence flag and actual distance
+        - Dict states are compared as arrays of their values ordered by key
+        - Reductions run as NumPy ufuncs over the whole difference array
     """
-    # TODO: Implement convergence checking with various metrics
-    raise NotImplementedError("check_convergence is not yet implemented")
+    if isinstance(state1, dict) or isinstance(state2, dict):
+        if not (isinstance(state1, dict) and isinstance(state2, dict)):
+            raise ValueError("cannot compare a dict state with a non-dict state")
+        if state1.keys() != state2.keys():
+            raise ValueError(f"state keys differ: {sorted(state1.keys() ^ state2.keys())}")
+    
+    a = _state_array(state1)
+    b = _state_array(state2)
+    if a.shape != b.shape:
+        raise ValueError(f"state shapes differ: {a.shape} vs {b.shape}")
+    
+    diff = np.subtract(a, b, dtype=np.float64)
+    if metric == 'l2':
+        distance = np.linalg.norm(diff)
+    elif metric == 'l1':
+        distance = np.abs(diff).sum()
+    elif metric == 'linf':
+        distance = np.abs(diff).max() if diff.size else 0.0
+    elif metric == 'relative':
+        distance = np.linalg.norm(diff) / (np.linalg.norm(a) + 1e-30)
+    else:
+        raise ValueError(f"Unknown metric: {metric}. Must be one of: l2, l1, linf, relative")
+    
+    distance = float(distance)
+    return distance < threshold, distance
+
+
+def _state_array(state):
+    """Flatten a dict state (values ordered by key) or coerce an array-like state."""
+    if isinstance(state, dict):
+        return np.fromiter((state[k] for k in sorted(state)), dtype=np.float64,
+                           count=len(state))
+    return np.asarray(state, dtype=np.float64)
@@ -18,6 +18,46 @@ Applications:
 """
 
 import cmath
+import math
+import operator
+
+import numpy as np
+from numpy.polynomial import Chebyshev
+
+# B₂ₖ/(2k)! for k = 1..8, the Euler-Maclaurin correction coefficients
+_EM_COEFFS = tuple(
+    b / math.factorial(2 * k)
+    for k, b in enumerate((1/6, -1/30, 1/42, -1/30, 5/66,
+                           -691/2730, 7/6, -3617/510), start=1)
+)
+
+# Lanczos coefficients (g = 7, n = 9) for the complex log-gamma
+_LANCZOS_COEFFS = (
+    0.99999999999980993, 676.5203681218851, -1259.1392167224028,
+    771.32342877765313, -176.61502916214059, 12.507343278686905,
+    -0.13857109526572012, 9.9843695780195716e-6, 1.5056327351493116e-7,
+)
+
+# Riemann-Siegel zero search: (n, t) terms per evaluation block, bisection
+# cap, the t below which zeros are polished against compute_zeta, and
+# secant steps per polished zero
+_RS_BLOCK_ELEMENTS = 1 << 20
+_RS_MAX_BISECTIONS = 64
+_RS_EXACT_BELOW = 1e4
+_RS_SECANT_STEPS = 8
+
+# Ψ(p) = cos(2π(p² - p - 1/16)) / cos(2πp) is entire (the zeros of the
+# denominator cancel), so one Chebyshev interpolant on [0, 1] gives it and
+# the derivatives used by the C₁, C₂ Riemann-Siegel terms to ~1e-14
+_RS_PSI = Chebyshev.interpolate(
+    lambda p: np.cos(2 * np.pi * (p * p - p - 1 / 16)) / np.cos(2 * np.pi * p),
+    40, domain=[0, 1])
+_RS_PSI_D2 = _RS_PSI.deriv(2)
+_RS_PSI_D3 = _RS_PSI.deriv(3)
+_RS_PSI_D6 = _RS_PSI.deriv(6)
+
+# Sieved primes keyed by max_prime, shared across euler_product_decomposition calls
+_PRIME_CACHE = {}
 
 
 def zeta_spectral_filter(voice_spectrum, critical_line_projection=True, 
@@ -70,46 +110,126 @@ def zeta_spectral_filter(voice_spectrum, critical_line_projection=True,
     if isinstance(voice_spectrum, dict):
         spectrum_type = 'dict'
         modes = list(voice_spectrum.keys())
+        values = voice_spectrum.values()
     elif isinstance(voice_spectrum, (list, tuple)):
         spectrum_type = 'list'
         modes = list(range(len(voice_spectrum)))
+        values = voice_spectrum
     else:
         raise ValueError("voice_spectrum must be dict, list, or tuple")
     
+    # Amplitudes as one contiguous complex array, in mode order
+    try:
+        amplitudes = np.fromiter(values, dtype=np.complex128, count=len(modes))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"voice_spectrum amplitudes must be numeric: {e}")
+    
+    spectral_energy = float(np.vdot(amplitudes, amplitudes).real)
+    
     # Placeholder return
     return {
         'filtered_spectrum': voice_spectrum,  # TODO: Apply actual filtering
         'prime_components': [],  # TODO: Identify prime voice signatures
         'resonant_modes': [],  # TODO: Detect modes on critical line
         'zeta_zeros_nearby': [],  # TODO: Find nearby non-trivial zeros
-        'spectral_energy': 0.0,  # TODO: Compute actual spectral energy
+        'spectral_energy': spectral_energy,
         'note': 'Placeholder implementation - full zeta spectral analysis pending'
     }
 
 
-def compute_zeta(s, num_terms=1000):
+def compute_zeta(s, num_terms=None):
     """
     Compute the Riemann zeta function ζ(s) for complex argument s.
     
-    Uses the Dirichlet series expansion for Re(s) > 1 and analytic
-    continuation for other values.
+    For Re(s) ≥ 1/2 uses Euler-Maclaurin summation: the Dirichlet series is
+    summed directly up to N terms and the tail is replaced by its integral
+    plus eight Bernoulli corrections. N is at least |s| + 20, which bounds
+    the truncation error near machine precision. For Re(s) < 1/2 the
+    functional equation ζ(s) = 2ˢ πˢ⁻¹ sin(πs/2) Γ(1-s) ζ(1-s) maps s to
+    the right half-plane, where the sum does not cancel catastrophically.
     
     Args:
         s (complex): Complex argument where zeta function is evaluated
-        num_terms (int): Number of terms in series expansion
+        num_terms (int, optional): Minimum number of series terms N
+            Raised to |s| + 20 when smaller; larger N costs accuracy for
+            Re(s) < 1, where the partial sum and tail grow like N^(1-Re(s))
     
     Returns:
         complex: Value of ζ(s)
     
-    Implementation Notes:
-        - TODO: Implement Dirichlet series for Re(s) > 1
-        - TODO: Implement analytic continuation using functional equation
-        - TODO: Handle special cases (poles, zeros)
-        - TODO: Optimize using advanced summation techniques (Euler-Maclaurin)
+    Raises:
+        ValueError: If s = 1 (pole) or num_terms < 1
+    
+    Example:
+        >>> compute_zeta(2)  # π²/6
+        (1.6449340668482266+0j)
+        >>> compute_zeta(-5)  # -1/252
+        (-0.003968253968253974+0j)
     """
-    # TODO: Implement actual zeta function computation
-    # Full implementation should compute Σ n⁻ˢ with appropriate convergence
-    raise NotImplementedError("compute_zeta is not yet implemented")
+    s = complex(s)
+    if s == 1:
+        raise ValueError("ζ(s) has a pole at s = 1")
+    if num_terms is not None and num_terms < 1:
+        raise ValueError("num_terms must be positive")
+    
+    if s.real >= 0.5:
+        return _zeta_euler_maclaurin(s, num_terms)
+    
+    if s == 0:
+        return complex(-0.5)
+    if s.imag == 0 and s.real % 2 == 0:
+        return 0j  # trivial zeros at -2, -4, ...
+    
+    # Functional equation, with the Γ and sin growth combined in log space
+    log_factor = (s * math.log(2) + (s - 1) * math.log(math.pi)
+                  + _log_sin(math.pi * s / 2) + _log_gamma(1 - s))
+    zeta = cmath.exp(log_factor) * _zeta_euler_maclaurin(1 - s, num_terms)
+    return complex(zeta.real) if s.imag == 0 else zeta  # ζ is real on the real axis
+
+
+def _zeta_euler_maclaurin(s, num_terms=None):
+    """Euler-Maclaurin ζ(s) with N ≥ |s| + 20 terms; intended for Re(s) ≥ 1/2."""
+    num_terms = max(num_terms or 0, math.ceil(abs(s)) + 20)
+    
+    N = float(num_terms)
+    n = np.arange(1, num_terms, dtype=np.float64)
+    partial = np.power(n, -s).sum()
+    
+    # Tail: ∫_N^∞ x⁻ˢ dx + N⁻ˢ/2
+    N_pow = N ** -s
+    total = partial + N * N_pow / (s - 1) + 0.5 * N_pow
+    
+    # Bernoulli corrections B₂ₖ/(2k)! · s(s+1)…(s+2k-2) · N^(-s-2k+1)
+    rising = s
+    term = N_pow / N
+    for k, coeff in enumerate(_EM_COEFFS):
+        if k:
+            rising *= (s + 2 * k - 1) * (s + 2 * k)
+            term /= N * N
+        total += coeff * rising * term
+    
+    return complex(total)
+
+
+def _log_gamma(z):
+    """log Γ(z) for Re(z) ≥ 1/2 (Lanczos, g = 7), up to a multiple of 2πi."""
+    z -= 1
+    x = _LANCZOS_COEFFS[0]
+    for i, c in enumerate(_LANCZOS_COEFFS[1:], start=1):
+        x += c / (z + i)
+    t = z + 7.5
+    return 0.5 * math.log(2 * math.pi) + (z + 0.5) * cmath.log(t) - t + cmath.log(x)
+
+
+def _log_sin(z):
+    """log sin(z), up to a multiple of 2πi, without overflow for large |Im z|."""
+    if abs(z.imag) < 20:
+        return cmath.log(cmath.sin(z))
+    if z.imag > 0:
+        # sin z = (i/2) e^{-iz} (1 - e^{2iz})
+        return -1j * z + cmath.log(0.5j) + cmath.log(1 - cmath.exp(2j * z))
+    # sin z = (-i/2) e^{iz} (1 - e^{-2iz})
+    return 1j * z + cmath.log(-0.5j) + cmath.log(1 - cmath.exp(-2j * z))
 
 
 def find_zeta_zeros(t_min, t_max, resolution=0.1):
@@ -128,19 +248,124 @@ def find_zeta_zeros(t_min, t_max, resolution=0.1):
         list: List of imaginary parts t where ζ(1/2 + it) ≈ 0
             Each element is a dict: {'t': float, 'residual': float}
     
+    Raises:
+        ValueError: If the range is empty or resolution is not positive
+    
+    Example:
+        >>> [round(z['t'], 3) for z in find_zeta_zeros(10, 30)]
+        [14.135, 21.022, 25.011]
+    
     Implementation Notes:
-        - TODO: Implement zero-finding using Riemann-Siegel formula
-        - TODO: Use argument principle to count zeros
-        - TODO: Refine zero locations using Newton's method
-        - TODO: Verify zeros satisfy |ζ(1/2 + it)| < tolerance
+        - The real Riemann-Siegel function Z(t) = e^{iθ(t)} ζ(1/2 + it) is
+          evaluated with its C₀..C₂ remainder terms (error O(t^-7/4)) on the
+          whole t grid, in blocks that shrink as the √(t/2π)-term main sum
+          grows, to bound memory
+        - Zeros are sign changes of Z between grid points, bisected on all
+          brackets at once down to float resolution
+        - Below t = 1e4 each zero is then polished by secant steps on the
+          exact Z from compute_zeta and the residual is |ζ(1/2 + it)|; above
+          it compute_zeta costs O(t) per call, so the zero of the corrected
+          Riemann-Siegel Z is returned and the residual is |Z| there
+        - Zeros closer together than resolution can be missed
     """
-    # Placeholder
-    # Known zeros: t ≈ 14.135, 21.022, 25.011, 30.425, 32.935, ...
-    # Full implementation should compute these numerically
-    return []
+    if resolution <= 0:
+        raise ValueError("resolution must be positive")
+    if not 0 < t_min < t_max:
+        raise ValueError("require 0 < t_min < t_max")
+    
+    num_points = int(math.ceil((t_max - t_min) / resolution)) + 1
+    t = np.linspace(t_min, t_max, num_points)
+    Z = _riemann_siegel_z_blocked(t)
+    
+    negative = np.signbit(Z)
+    brackets = np.flatnonzero(negative[:-1] ^ negative[1:])
+    lo, hi = t[brackets], t[brackets + 1]
+    lo_negative = negative[brackets]
+    for _ in range(_RS_MAX_BISECTIONS):
+        mid = 0.5 * (lo + hi)
+        if not np.any((lo < mid) & (mid < hi)):
+            break  # every bracket is down to adjacent floats
+        left = np.signbit(_riemann_siegel_z_blocked(mid)) == lo_negative
+        lo = np.where(left, mid, lo)
+        hi = np.where(left, hi, mid)
+    
+    roots = 0.5 * (lo + hi)
+    exact = roots < _RS_EXACT_BELOW
+    residuals = np.zeros_like(roots)
+    residuals[~exact] = np.abs(_riemann_siegel_z_blocked(roots[~exact]))
+    
+    zeros = []
+    for root, residual, polish in zip(roots.tolist(), residuals.tolist(),
+                                      exact.tolist()):
+        if polish:
+            root, residual = _polish_zero(root, resolution)
+        zeros.append({'t': root, 'residual': residual})
+    return zeros
 
 
-def euler_product_decomposition(n, max_prime=100):
+def _polish_zero(t, resolution):
+    """Secant iteration on Z(t) = Re(e^{iθ(t)} ζ(1/2 + it)) using compute_zeta."""
+    num_terms = max(1000, int(t))
+    
+    def exact_z(x):
+        zeta = compute_zeta(complex(0.5, x), num_terms)
+        return (cmath.exp(1j * float(_riemann_siegel_theta(x))) * zeta).real
+    
+    t0, t1 = t, t + 1e-6
+    z0, z1 = exact_z(t0), exact_z(t1)
+    for _ in range(_RS_SECANT_STEPS):
+        if z1 == z0:
+            break
+        t0, t1 = t1, t1 - z1 * (t1 - t0) / (z1 - z0)
+        if abs(t1 - t) > resolution:
+            return t, abs(exact_z(t))  # diverged; keep the bracketed estimate
+        z0, z1 = z1, exact_z(t1)
+        if abs(t1 - t0) < 1e-12 * t1:
+            break
+    return t1, abs(z1)
+
+
+def _riemann_siegel_theta(t):
+    """Riemann-Siegel θ(t) from its asymptotic expansion."""
+    return (t / 2 * np.log(t / (2 * np.pi)) - t / 2 - np.pi / 8
+            + 1 / (48 * t) + 7 / (5760 * t ** 3))
+
+
+def _riemann_siegel_z_blocked(t):
+    """_riemann_siegel_z over t in blocks of about _RS_BLOCK_ELEMENTS (n, t) terms."""
+    Z = np.empty_like(t)
+    if t.size == 0:
+        return Z
+    n_max = int(math.sqrt(t.max() / (2 * math.pi))) + 1
+    block = max(1, _RS_BLOCK_ELEMENTS // n_max)
+    for start in range(0, t.size, block):
+        Z[start:start + block] = _riemann_siegel_z(t[start:start + block])
+    return Z
+
+
+def _riemann_siegel_z(t):
+    """
+    Vectorized Riemann-Siegel Z(t) with the C₀, C₁, C₂ remainder terms.
+    
+    The main sum runs over n ≤ √(t/2π), broadcast as an (n, t) grid and
+    masked per column. With a = √(t/2π) and p its fractional part the
+    remainder is (-1)^(N-1) a^(-1/2) (C₀ + C₁/a + C₂/a²), where C₀ = Ψ(p),
+    C₁ = -Ψ⁽³⁾(p)/(96π²) and C₂ = Ψ⁽²⁾(p)/(64π²) + Ψ⁽⁶⁾(p)/(18432π⁴).
+    """
+    a = np.sqrt(t / (2 * np.pi))
+    N = np.floor(a)
+    p = a - N
+    n = np.arange(1, int(N.max(initial=0)) + 1, dtype=np.float64)[:, None]
+    terms = np.cos(_riemann_siegel_theta(t) - t * np.log(n)) / np.sqrt(n)
+    main = 2 * np.where(n <= N, terms, 0.0).sum(axis=0)
+    C0 = _RS_PSI(p)
+    C1 = -_RS_PSI_D3(p) / (96 * np.pi ** 2)
+    C2 = _RS_PSI_D2(p) / (64 * np.pi ** 2) + _RS_PSI_D6(p) / (18432 * np.pi ** 4)
+    remainder = (C0 + (C1 + C2 / a) / a) / np.sqrt(a)
+    return main + np.where(N % 2 == 1, 1.0, -1.0) * remainder
+
+
+def euler_product_decomposition(n, max_prime=100, s=2):
     """
     Decompose a positive integer n using the Euler product structure.
     
@@ -150,29 +375,91 @@ def euler_product_decomposition(n, max_prime=100):
     Args:
         n (int): Positive integer to decompose
         max_prime (int): Maximum prime to consider in factorization
+        s (complex): Point at which the Euler factors are evaluated
     
     Returns:
         dict: Prime factorization
             {
                 'prime_factors': dict mapping prime p to exponent e,
-                'euler_factors': list of (1 - p⁻ˢ)⁻¹ terms,
-                'is_prime': bool (whether n itself is prime)
+                'euler_factors': complex128 ndarray of (1 - p⁻ˢ)⁻¹ terms,
+                'is_prime': bool (whether n itself is prime),
+                'remainder': int (cofactor left unfactored, 1 if complete)
             }
     
+    Raises:
+        ValueError: If n is not a positive integer, max_prime is negative,
+            or s is a pole of an Euler factor (p⁻ˢ = 1, e.g. s = 0)
+    
     Implementation Notes:
-        - TODO: Implement efficient prime factorization
-        - TODO: Compute Euler factors for zeta function representation
-        - TODO: Identify "prime voice" signatures (n is prime)
+        - Trial division over primes ≤ min(max_prime, √n) from a cached sieve
+        - A cofactor with no prime divisor ≤ √cofactor is itself prime;
+          otherwise it is returned as 'remainder'
     """
-    # Placeholder
+    try:
+        if isinstance(n, bool):
+            raise TypeError
+        n = operator.index(n)
+        max_prime = operator.index(max_prime)
+    except TypeError:
+        raise ValueError("n and max_prime must be integers")
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    if max_prime < 0:
+        raise ValueError("max_prime must be non-negative")
+    if s == 0:
+        raise ValueError("Euler factors (1 - p⁻ˢ)⁻¹ have a pole at s = 0")
+    
+    # Only primes ≤ √n can be trial divisors; the cached sieve may be far
+    # longer. The key takes the sieve's dtype so searchsorted does not cast
+    # the whole array.
+    root = math.isqrt(n)
+    primes = _primes_upto(max_prime)
+    key = primes.dtype.type(min(root, max_prime))
+    primes = primes[:np.searchsorted(primes, key, side='right')]
+    
+    prime_factors = {}
+    remaining = n
+    for p in primes.tolist():
+        if p * p > remaining:
+            break
+        while remaining % p == 0:
+            prime_factors[p] = prime_factors.get(p, 0) + 1
+            remaining //= p
+    else:
+        p = min(max_prime, root) + 1  # smallest candidate not tried
+    
+    if remaining > 1 and p * p > remaining:
+        prime_factors[remaining] = prime_factors.get(remaining, 0) + 1
+        remaining = 1
+    
+    try:
+        euler_factors = np.fromiter((1 / (1 - p ** -s) for p in prime_factors),
+                                    dtype=np.complex128, count=len(prime_factors))
+    except ZeroDivisionError:
+        raise ValueError(f"Euler factors (1 - p⁻ˢ)⁻¹ have a pole at s = {s}")
+    
     return {
-        'prime_factors': {},
-        'euler_factors': [],
-        'is_prime': False,
-        'note': 'Placeholder - full Euler product decomposition pending'
+        'prime_factors': prime_factors,
+        'euler_factors': euler_factors,
+        'is_prime': remaining == 1 and prime_factors == {n: 1},
+        'remainder': remaining
     }
 
 
+def _primes_upto(max_prime):
+    """Primes ≤ max_prime via a vectorized sieve of Eratosthenes, cached per bound."""
+    primes = _PRIME_CACHE.get(max_prime)
+    if primes is None:
+        sieve = np.ones(max(max_prime, 1) + 1, dtype=bool)
+        sieve[:2] = False
+        for i in range(2, math.isqrt(max_prime) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = False
+        primes = np.flatnonzero(sieve).astype(np.uint32)
+        _PRIME_CACHE[max_prime] = primes
+    return primes
+
+
 def critical_line_projection(spectrum_point):
     """
     Project a spectral point onto the critical line Re(s) = 1/2.
@@ -182,10 +469,25 @@ def critical_line_projection(spectrum_point):
     
     Returns:
         complex: Projected point on critical line (Re = 1/2)
+            1/2 + i·Im(spectrum_point), preserving the imaginary part
+    """
+    return complex(0.5, complex(spectrum_point).imag)
+
+
+def critical_line_projection_bulk(spectrum_points):
+    """
+    Project an array of spectral points onto the critical line Re(s) = 1/2.
     
-    Implementation Notes:
-        - TODO: Implement projection preserving imaginary part
-        - TODO: Return 1/2 + i*Im(spectrum_point)
+    Vectorized form of critical_line_projection for many points at once.
+    
+    Args:
+        spectrum_points (array-like): Points in complex spectral plane
+    
+    Returns:
+        np.ndarray: complex128 array of 1/2 + i·Im(point), same shape as input
     """
-    # Placeholder
-    return complex(0.5, 0)
+    points = np.asarray(spectrum_points, dtype=np.complex128)
+    projected = np.empty_like(points)
+    projected.real = 0.5
+    projected.imag = points.imag
+    return projected
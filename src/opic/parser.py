@@ -16,9 +16,38 @@ enriched with field-theoretic structure, and parsing is the act of constructing
 this geometric embedding.
 """
 
+from __future__ import annotations
+
+import copy
 import json
+import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_VALID_TOPOLOGIES = frozenset({'euclidean', 'hyperbolic', 'spherical', 'toroidal'})
+
+# Single-pass .ops tokenizer; alternatives are tried in order, so the
+# keyword precedes ws and ident, and the catch-all comes last. `voice` is a
+# declaration only at the start of a line (as in core/parser.parse_ops);
+# newlines are separate ws tokens so the anchor can match after them.
+_TOKEN_RE = re.compile(r'''
+    (?P<comment>;[^\n]*)
+  | (?P<voice>^[ \t]*voice\b)
+  | (?P<ws>[^\S\n]+|\n)
+  | (?P<arrow>->|→)
+  | (?P<str>"(?:[^"\\]|\\.)*")
+  | (?P<ident>[A-Za-z_][\w.]*)
+  | (?P<lbrace>\{)
+  | (?P<rbrace>\})
+  | (?P<slash>/)
+  | (?P<other>\S)
+''', re.VERBOSE | re.MULTILINE)
+
 
 def initialize_field_geometry(source_code: str, 
                                topology: str = 'euclidean',
@@ -75,25 +104,43 @@ def initialize_field_geometry(source_code: str,
         - TODO: Construct invariant functionals from invariant list
         - TODO: Extract/verify cryptographic certificates
         - TODO: Build chain embeddings from voice composition patterns
+        - Geometries are memoized on (source_code, topology, dimension,
+          invariants); each call returns a deep copy, so callers may mutate it.
+          Unhashable invariant entries skip the cache and build directly
     """
     # Input validation
     if not source_code or not isinstance(source_code, str):
         raise ValueError("source_code must be a non-empty string")
     
-    valid_topologies = ['euclidean', 'hyperbolic', 'spherical', 'toroidal']
-    if topology not in valid_topologies:
+    if topology not in _VALID_TOPOLOGIES:
         raise ValueError(f"Unknown topology: {topology}. "
-                        f"Must be one of {valid_topologies}")
+                        f"Must be one of {sorted(_VALID_TOPOLOGIES)}")
     
     # Default invariants if not specified
     if invariants is None:
         invariants = ['energy', 'coherence']
     
+    invariants = tuple(invariants)
+    try:
+        hash(invariants)
+    except TypeError:
+        return _build_field_geometry(source_code, topology, dimension, invariants)
+    geometry = _initialize_field_geometry_cached(source_code, topology, dimension,
+                                                 invariants)
+    return copy.deepcopy(geometry)
+
+
+def _build_field_geometry(source_code: str, topology: str,
+                          dimension: Optional[int],
+                          invariants: tuple) -> Dict[str, Any]:
+    """Build the field geometry for initialize_field_geometry."""
+    invariants = list(invariants)
+    
     # Placeholder implementation
     # TODO: Actual parsing and geometry construction
     
-    # Step 1: Tokenize and parse voice definitions
-    # voices_raw = parse_voice_definitions(source_code)
+    # Step 1: Tokenize and collect voice definitions
+    voices_raw = _voice_names(_tokenize(source_code))
     
     # Step 2: Infer dimension from voice composition structure
     if dimension is None:
@@ -103,7 +150,7 @@ def initialize_field_geometry(source_code: str,
     manifold = _construct_manifold(topology, dimension)
     
     # Step 4: Embed voices as vector fields
-    voices = []  # Placeholder - should contain voice embeddings
+    voices = [{'name': name} for name in voices_raw]  # Placeholder - names only, no vector fields yet
     
     # Step 5: Build connection for parallel transport
     connection = _construct_connection(manifold, invariants)
@@ -131,6 +178,34 @@ def initialize_field_geometry(source_code: str,
     }
 
 
+# Memoized builder; its results are shared between calls, so do not mutate them
+_initialize_field_geometry_cached = lru_cache(maxsize=128)(_build_field_geometry)
+
+
+def _tokenize(source_code: str):
+    """
+    Tokenize .ops source in one pass over _TOKEN_RE.
+    
+    Yields:
+        tuple: (kind, text) for each token, skipping whitespace and comments
+    """
+    for match in _TOKEN_RE.finditer(source_code):
+        kind = match.lastgroup
+        if kind != 'ws' and kind != 'comment':
+            yield kind, match.group().strip() if kind == 'voice' else match.group()
+
+
+def _voice_names(tokens) -> List[str]:
+    """Names of voices declared as `voice <name> / {...}`, in source order."""
+    names = []
+    expect_name = False
+    for kind, text in tokens:
+        if expect_name and kind == 'ident':
+            names.append(text)
+        expect_name = kind == 'voice'
+    return names
+
+
 def _construct_manifold(topology: str, dimension: int) -> Dict[str, Any]:
     """
     Construct the base manifold for field geometry.
@@ -199,13 +274,14 @@ def _construct_invariant_functionals(invariants: List[str]) -> Dict[str, callabl
         - TODO: Define functional form for each standard invariant
         - TODO: Support custom invariants via plugin system
     """
-    # Placeholder
-    functionals = {}
-    for inv in invariants:
-        # Each should be a callable: state -> float
-        # Use closure to capture current value of inv
-        functionals[inv] = (lambda i: lambda state: 0.0)(inv)  # Placeholder
-    return functionals
+    # Placeholder: each should be a callable state -> float; until real
+    # functionals exist, every invariant shares the same zero functional
+    return dict.fromkeys(invariants, _zero_functional)
+
+
+def _zero_functional(state: Any) -> float:
+    """Placeholder invariant functional: evaluates to 0.0 on every state."""
+    return 0.0
 
 
 def parse_json_config(config_path: str) -> Dict[str, Any]:
@@ -241,10 +317,20 @@ def parse_json_config(config_path: str) -> Dict[str, Any]:
     """
     # Placeholder
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        return config
+        with open(config_path, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    except json.JSONDecodeError as e:
+    
+    # orjson only speeds up the strict RFC 8259 subset; anything it rejects
+    # (NaN, Infinity, integers beyond 64 bits, ...) goes through json.loads,
+    # so the accepted grammar is exactly the stdlib's
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise ValueError(f"Invalid JSON in configuration file: {e}")